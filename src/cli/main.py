@@ -8,11 +8,26 @@ Provides command-line access to the system update functionality.
 import sys
 import argparse
 import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 
-from core.config import ConfigManager
-from core.orchestrator import SystemUpdater
+# The log formats never use thread or process fields, so skip collecting them
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+logger = logging.getLogger('system-updater.cli')
+
+# Formatters are shared by every handler setup_logging() installs
+_CONSOLE_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+_FILE_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
 
 
 def setup_logging(log_level: str, log_file: Optional[str] = None):
@@ -28,11 +43,7 @@ def setup_logging(log_level: str, log_file: Optional[str] = None):
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
-    console_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    console_handler.setFormatter(console_formatter)
+    console_handler.setFormatter(_CONSOLE_FORMATTER)
     root_logger.addHandler(console_handler)
     
     # File handler if specified
@@ -41,15 +52,15 @@ def setup_logging(log_level: str, log_file: Optional[str] = None):
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
         file_handler = logging.FileHandler(log_path)
-        file_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        file_handler.setFormatter(file_formatter)
+        file_handler.setFormatter(_FILE_FORMATTER)
         root_logger.addHandler(file_handler)
 
 
 def cmd_update(args):
     """Handle the update command."""
+    from core.base import UpdateStatus
+    from core.config import ConfigManager
+    from core.orchestrator import SystemUpdater
     
     # Load configuration
     config_manager = ConfigManager(args.config)
@@ -57,8 +68,6 @@ def cmd_update(args):
     # Set up logging
     setup_logging(config_manager.config.log_level, config_manager.config.log_file)
     
-    logger = logging.getLogger('system-updater.cli')
-    
     # Override dry-run if specified
     if args.dry_run:
         config_manager.config.dry_run = True
@@ -78,9 +87,10 @@ def cmd_update(args):
         
         # Report results
         total_updates = len(results)
-        successful = len([r for r in results if r.status.value == 'success'])
-        failed = len([r for r in results if r.status.value == 'failed'])
-        skipped = len([r for r in results if r.status.value == 'skipped'])
+        counts = Counter(r.status for r in results)
+        successful = counts[UpdateStatus.SUCCESS]
+        failed = counts[UpdateStatus.FAILED]
+        skipped = counts[UpdateStatus.SKIPPED]
         
         logger.info(f"Update completed: {successful} successful, {failed} failed, {skipped} skipped out of {total_updates} total")
         
@@ -97,6 +107,8 @@ def cmd_update(args):
 
 def cmd_list(args):
     """Handle the list command."""
+    from core.config import ConfigManager
+    from core.orchestrator import SystemUpdater
     
     config_manager = ConfigManager(args.config)
     setup_logging(config_manager.config.log_level)
@@ -107,8 +119,12 @@ def cmd_list(args):
     print("Available package managers:")
     print()
     
+    # Probe availability concurrently; each probe may shell out
+    with ThreadPoolExecutor(max_workers=max(1, min(len(managers), 8))) as executor:
+        available = dict(zip(managers, executor.map(lambda m: m.is_available, managers.values())))
+    
     for manager_name, manager in managers.items():
-        status = "✓ Available" if manager.is_available() else "✗ Not available"
+        status = "✓ Available" if available[manager_name] else "✗ Not available"
         enabled = "Enabled" if manager.enabled else "Disabled"
         
         print(f"  {manager_name:15} - {status:15} ({enabled})")
@@ -118,6 +134,8 @@ def cmd_list(args):
 
 def cmd_status(args):
     """Handle the status command."""
+    from core.config import ConfigManager
+    from core.orchestrator import SystemUpdater
     
     config_manager = ConfigManager(args.config)
     setup_logging(config_manager.config.log_level)
@@ -128,34 +146,27 @@ def cmd_status(args):
     print("===================")
     print()
     
-    managers = updater.get_available_managers()
-    
-    for manager_name, manager in managers.items():
-        if not manager.enabled:
-            continue
-            
-        if not manager.is_available():
+    # Availability probes and update checks run concurrently in the orchestrator
+    for manager_name, updates in updater.check_enabled_managers().items():
+        if updates is None:
             print(f"{manager_name}: Not available")
             continue
         
-        try:
-            updates = manager.check_updates()
-            if updates:
-                print(f"{manager_name}: {len(updates)} updates available")
-                if args.verbose:
-                    for update in updates[:5]:  # Show first 5
-                        version_info = ""
-                        if update.current_version and update.available_version:
-                            version_info = f" ({update.current_version} -> {update.available_version})"
-                        print(f"  - {update.name}{version_info}")
-                    
-                    if len(updates) > 5:
-                        print(f"  ... and {len(updates) - 5} more")
-            else:
-                print(f"{manager_name}: Up to date")
+        if isinstance(updates, Exception):
+            print(f"{manager_name}: Error checking updates - {updates}")
+        elif updates:
+            print(f"{manager_name}: {len(updates)} updates available")
+            if args.verbose:
+                for update in updates[:5]:  # Show first 5
+                    version_info = ""
+                    if update.current_version and update.available_version:
+                        version_info = f" ({update.current_version} -> {update.available_version})"
+                    print(f"  - {update.name}{version_info}")
                 
-        except Exception as e:
-            print(f"{manager_name}: Error checking updates - {e}")
+                if len(updates) > 5:
+                    print(f"  ... and {len(updates) - 5} more")
+        else:
+            print(f"{manager_name}: Up to date")
         
         print()
     
@@ -164,6 +175,7 @@ def cmd_status(args):
 
 def cmd_config(args):
     """Handle the config command."""
+    from core.config import ConfigManager
     
     config_manager = ConfigManager(args.config)
     
@@ -207,13 +219,7 @@ def cmd_config(args):
         return 0
 
 
-def main():
-    """Main CLI entry point."""
-    
-    parser = argparse.ArgumentParser(
-        description="System package updater with component-based architecture",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_EPILOG = """
 Examples:
   %(prog)s update all              # Update all enabled package managers
   %(prog)s update homebrew         # Update only Homebrew packages
@@ -221,6 +227,79 @@ Examples:
   %(prog)s list                    # List available package managers
   %(prog)s config --init           # Create default configuration file
         """
+
+
+def _add_update_parser(subparsers):
+    """Attach the update command."""
+    update_parser = subparsers.add_parser('update', help='Update packages')
+    update_parser.add_argument(
+        'manager',
+        choices=['all', 'homebrew', 'mac_app_store', 'npm', 'python', 'ruby', 'r_packages', 'texlive', 'vscode'],
+        help='Package manager to update'
+    )
+    update_parser.set_defaults(func=cmd_update)
+
+
+def _add_list_parser(subparsers):
+    """Attach the list command."""
+    list_parser = subparsers.add_parser('list', help='List available package managers')
+    list_parser.set_defaults(func=cmd_list)
+
+
+def _add_status_parser(subparsers):
+    """Attach the status command."""
+    status_parser = subparsers.add_parser('status', help='Check update status')
+    status_parser.set_defaults(func=cmd_status)
+
+
+def _add_config_parser(subparsers):
+    """Attach the config command."""
+    config_parser = subparsers.add_parser('config', help='Manage configuration')
+    config_group = config_parser.add_mutually_exclusive_group()
+    config_group.add_argument('--init', action='store_true', help='Initialize new config file')
+    config_group.add_argument('--validate', action='store_true', help='Validate current config')
+    config_parser.add_argument('--force', action='store_true', help='Force overwrite existing config')
+    config_parser.set_defaults(func=cmd_config)
+
+
+# Subcommand parser factories, in help order
+_COMMAND_PARSERS = {
+    'update': _add_update_parser,
+    'list': _add_list_parser,
+    'status': _add_status_parser,
+    'config': _add_config_parser,
+}
+
+
+def _detect_command(argv: List[str]) -> Optional[str]:
+    """
+    Find the subcommand named in argv without a full parse.
+    
+    Returns None when help is requested or no known command is found, in
+    which case every subcommand parser should be attached.
+    """
+    if '-h' in argv or '--help' in argv:
+        return None
+    
+    args = iter(argv)
+    for arg in args:
+        if arg in ('--config', '-c'):
+            next(args, None)  # Skip the option value
+        elif not arg.startswith('-'):
+            return arg if arg in _COMMAND_PARSERS else None
+    
+    return None
+
+
+def main():
+    """Main CLI entry point."""
+    
+    argv = sys.argv[1:]
+    
+    parser = argparse.ArgumentParser(
+        description="System package updater with component-based architecture",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
     
     parser.add_argument(
@@ -241,36 +320,18 @@ Examples:
         help='Enable verbose output'
     )
     
-    # Subcommands
+    # Subcommands - only the requested one is built when it can be detected
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
-    # Update command
-    update_parser = subparsers.add_parser('update', help='Update packages')
-    update_parser.add_argument(
-        'manager',
-        choices=['all', 'homebrew', 'mac_app_store', 'npm', 'python', 'ruby', 'r_packages', 'texlive', 'vscode'],
-        help='Package manager to update'
-    )
-    update_parser.set_defaults(func=cmd_update)
-    
-    # List command
-    list_parser = subparsers.add_parser('list', help='List available package managers')
-    list_parser.set_defaults(func=cmd_list)
-    
-    # Status command  
-    status_parser = subparsers.add_parser('status', help='Check update status')
-    status_parser.set_defaults(func=cmd_status)
-    
-    # Config command
-    config_parser = subparsers.add_parser('config', help='Manage configuration')
-    config_group = config_parser.add_mutually_exclusive_group()
-    config_group.add_argument('--init', action='store_true', help='Initialize new config file')
-    config_group.add_argument('--validate', action='store_true', help='Validate current config')
-    config_parser.add_argument('--force', action='store_true', help='Force overwrite existing config')
-    config_parser.set_defaults(func=cmd_config)
+    command = _detect_command(argv)
+    if command:
+        _COMMAND_PARSERS[command](subparsers)
+    else:
+        for add_parser in _COMMAND_PARSERS.values():
+            add_parser(subparsers)
     
     # Parse arguments
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
@@ -5,12 +5,18 @@ Abstract base class for package managers.
 This module defines the interface that all package managers must implement.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
 from typing import List, Dict, Optional, Tuple, Any
 import logging
 
+from utils.compat import DATACLASS_SLOTS
+
+
+_ROOT_LOG = logging.getLogger("system-updater")
+
 
 class UpdateStatus(Enum):
     """Status of a package update operation."""
@@ -22,7 +28,7 @@ class UpdateStatus(Enum):
     NOT_AVAILABLE = "not_available"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PackageInfo:
     """Information about a package."""
     name: str
@@ -33,7 +39,7 @@ class PackageInfo:
     manager: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class UpdateResult:
     """Result of an update operation."""
     package: PackageInfo
@@ -49,6 +55,10 @@ class PackageManager(ABC):
     Each package manager (homebrew, npm, pip, etc.) must implement this interface.
     """
     
+    # Capabilities; subclasses that override update_self/cleanup set these
+    supports_self_update = False
+    supports_cleanup = False
+    
     def __init__(self, name: str, config: Dict[str, Any], logger: Optional[logging.Logger] = None):
         """
         Initialize the package manager.
@@ -59,21 +69,44 @@ class PackageManager(ABC):
             logger: Logger instance to use
         """
         self.name = name
+        self._log_prefix = f"[{name}]"
         self.config = config
-        self.logger = logger or logging.getLogger(f"system-updater.{name}")
+        self.logger = logger or _ROOT_LOG.getChild(name)
         self.enabled = config.get('enabled', True)
         self.dry_run = config.get('dry_run', False)
+        self._excluded = frozenset(config.get('exclude_packages', ()))
+        self._available: Optional[bool] = None
         
     @abstractmethod
-    def is_available(self) -> bool:
+    def _probe_available(self) -> bool:
         """
         Check if this package manager is available on the system.
         
+        Called at most once per instance through ``is_available``.
+        
         Returns:
             True if the package manager is installed and usable
         """
         pass
     
+    @property
+    def is_available(self) -> bool:
+        """
+        Whether this package manager is available on the system.
+        
+        The probe runs once per instance and the result is cached; subclasses
+        must not rely on it being re-evaluated during a run.
+        """
+        # Memoized on the instance rather than with cached_property, which
+        # serializes every instance's probe behind one lock before Python 3.12
+        if self._available is None:
+            self._available = self._probe_available()
+        return self._available
+    
+    def invalidate_availability(self):
+        """Forget the cached ``is_available`` result so the next access re-probes."""
+        self._available = None
+    
     @abstractmethod
     def check_updates(self) -> List[PackageInfo]:
         """
@@ -84,6 +117,18 @@ class PackageManager(ABC):
         """
         pass
     
+    async def check_updates_async(self) -> List[PackageInfo]:
+        """
+        Check for available package updates from within an event loop.
+        
+        The default runs check_updates() in a worker thread; managers that
+        can drive their subprocesses with asyncio should override this.
+        
+        Returns:
+            List of packages that have updates available
+        """
+        return await asyncio.to_thread(self.check_updates)
+    
     @abstractmethod
     def update_packages(self, packages: Optional[List[str]] = None) -> List[UpdateResult]:
         """
@@ -141,7 +186,7 @@ class PackageManager(ABC):
         return {
             'name': self.name,
             'enabled': self.enabled,
-            'available': self.is_available(),
+            'available': self.is_available,
             'config': self.config
         }
     
@@ -161,7 +206,7 @@ class PackageManager(ABC):
         Returns:
             List of package names to skip
         """
-        return self.config.get('exclude_packages', [])
+        return list(self._excluded)
     
     def should_update_package(self, package_name: str) -> bool:
         """
@@ -173,7 +218,7 @@ class PackageManager(ABC):
         Returns:
             True if package should be updated
         """
-        if package_name in self.get_excluded_packages():
+        if package_name in self._excluded:
             return False
         
         # Additional logic can be added here
@@ -181,12 +226,12 @@ class PackageManager(ABC):
     
     def log_info(self, message: str):
         """Log an info message."""
-        self.logger.info(f"[{self.name}] {message}")
+        self.logger.info("%s %s", self._log_prefix, message)
     
     def log_warning(self, message: str):
         """Log a warning message."""
-        self.logger.warning(f"[{self.name}] {message}")
+        self.logger.warning("%s %s", self._log_prefix, message)
     
     def log_error(self, message: str):
         """Log an error message."""
-        self.logger.error(f"[{self.name}] {message}")
\ No newline at end of file
+        self.logger.error("%s %s", self._log_prefix, message)
\ No newline at end of file
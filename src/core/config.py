@@ -5,15 +5,160 @@ Configuration management for system-updater.
 Handles loading and validating YAML configuration files.
 """
 
+import io
 import os
-import yaml
+import copy
+import json
+import hashlib
+import tempfile
+import functools
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Tuple, Iterator, Mapping
 import logging
 from dataclasses import dataclass, field
 
+from utils.compat import DATACLASS_SLOTS
 
-@dataclass
+
+@functools.lru_cache(maxsize=None)
+def _yaml_classes() -> Tuple[type, type]:
+    """
+    Return the safe YAML (loader, dumper) classes.
+    
+    yaml is imported on first use so CLI paths that never read a config
+    file don't pay for it. The LibYAML C bindings are preferred when
+    PyYAML was built with them.
+    """
+    import yaml
+    try:
+        return yaml.CSafeLoader, yaml.CSafeDumper
+    except AttributeError:
+        return yaml.SafeLoader, yaml.SafeDumper
+
+# Accepted values for enumerated settings
+_VALID_LOG_LEVELS = frozenset({'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'})
+_VALID_SUDO_MODES = frozenset({'prompt', 'cache', 'skip', 'homebrew_only'})
+_VALID_SCHEDULES = frozenset({'daily', 'weekly', 'monthly'})
+
+# Parsed YAML files keyed by resolved path, validated against (mtime_ns, size)
+_YAML_CACHE_MAX_ENTRIES = 100
+_YAML_CACHE: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+
+
+def _cached_yaml_load(path: Path) -> Dict[str, Any]:
+    """
+    Load a YAML file, reusing the parsed result while the file is unchanged.
+    
+    Returns a deep copy so callers are free to mutate the result.
+    """
+    key = str(Path(path).resolve())
+    st = os.stat(key)
+    
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        _YAML_CACHE.move_to_end(key)
+        return copy.deepcopy(cached[2])
+    
+    data = _parse_yaml_file(Path(key), st.st_mtime_ns)
+    
+    _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    _YAML_CACHE.move_to_end(key)
+    if len(_YAML_CACHE) > _YAML_CACHE_MAX_ENTRIES:
+        _YAML_CACHE.popitem(last=False)
+    
+    return copy.deepcopy(data)
+
+
+class _YAMLParseError(ValueError):
+    """A config file is not valid YAML (wraps yaml.YAMLError)."""
+
+
+def _is_valid_choice(value: Any, choices: frozenset) -> bool:
+    """Check a setting against its accepted values (non-strings never match)."""
+    return isinstance(value, str) and value in choices
+
+
+def _json_sidecar_path(path: Path) -> Path:
+    """
+    Path of the JSON cache for a YAML file.
+    
+    Sidecars live in the user cache directory, named by a hash of the
+    resolved YAML path, so nothing is written next to the config itself
+    (which may be a symlink into a dotfiles repository).
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    digest = hashlib.sha256(str(path).encode('utf-8', 'surrogateescape')).hexdigest()
+    return Path(cache_home) / 'system-updater' / 'config' / f'{digest}.json'
+
+
+def _write_json_sidecar(cache_path: Path, text: str, yaml_mtime_ns: int):
+    """Atomically write a sidecar stamped with the mtime of the YAML it was parsed from."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+        os.utime(tmp_path, ns=(yaml_mtime_ns, yaml_mtime_ns))
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _parse_yaml_file(path: Path, yaml_mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a YAML file, preferring a matching JSON sidecar when one exists.
+    
+    After a YAML parse the result is written to the sidecar so the next
+    process can skip YAML entirely. The sidecar is stamped with the mtime
+    the YAML file had before it was read and records a SHA-256 of the
+    bytes that were parsed; it is only used while both match, so edits
+    are caught even on filesystems with coarse mtimes. Sidecar problems
+    are never fatal.
+    
+    Raises:
+        _YAMLParseError: the file is not valid YAML
+    """
+    cache_path = _json_sidecar_path(path)
+    
+    with open(path, 'rb') as f:
+        content = f.read()
+    digest = hashlib.sha256(content).hexdigest()
+    
+    try:
+        if cache_path.stat().st_mtime_ns == yaml_mtime_ns:
+            with open(cache_path, 'r') as f:
+                cached = json.load(f)
+            if (isinstance(cached, dict) and cached.get('sha256') == digest
+                    and isinstance(cached.get('data'), dict)):
+                return cached['data']
+    except (OSError, ValueError):
+        pass
+    
+    import yaml
+    
+    # Parse the hashed bytes, named so YAML errors still point at the file
+    stream = io.BytesIO(content)
+    stream.name = str(path)
+    try:
+        data = yaml.load(stream, Loader=_yaml_classes()[0]) or {}
+    except yaml.YAMLError as e:
+        raise _YAMLParseError(e) from e
+    
+    try:
+        text = json.dumps({'sha256': digest, 'data': data})
+        # Only persist values that survive a JSON round trip unchanged
+        if json.loads(text)['data'] == data:
+            _write_json_sidecar(cache_path, text, yaml_mtime_ns)
+    except (OSError, TypeError, ValueError):
+        pass
+    
+    return data
+
+
+@dataclass(**DATACLASS_SLOTS)
 class SystemUpdaterConfig:
     """System updater configuration."""
     
@@ -37,11 +182,20 @@ class SystemUpdaterConfig:
 class ConfigManager:
     """Manages configuration loading and validation."""
     
-    DEFAULT_CONFIG_PATHS = [
-        Path.home() / ".config" / "system-updater" / "config.yaml",
-        Path.home() / ".system-updater.yaml",
-        Path("config") / "default.yaml",
-    ]
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def _default_paths(cls) -> Tuple[Path, ...]:
+        """
+        Get the default configuration file locations, in lookup order.
+        
+        Resolved on first use rather than at import time.
+        """
+        home = Path.home()
+        return (
+            home / ".config" / "system-updater" / "config.yaml",
+            home / ".system-updater.yaml",
+            Path("config") / "default.yaml",
+        )
     
     def __init__(self, config_path: Optional[Path] = None):
         """
@@ -52,8 +206,19 @@ class ConfigManager:
         """
         self.logger = logging.getLogger("system-updater.config")
         self.config_path = config_path
+        self._manager_cfg_cache: Dict[str, Tuple[Tuple[Any, ...], Mapping[str, Any]]] = {}
         self.config = self.load_config()
     
+    @property
+    def config(self) -> SystemUpdaterConfig:
+        """The loaded configuration; assigning a new one clears the manager config cache."""
+        return self._config
+    
+    @config.setter
+    def config(self, value: SystemUpdaterConfig):
+        self._config = value
+        self.clear_manager_config_cache()
+    
     def load_config(self) -> SystemUpdaterConfig:
         """
         Load configuration from YAML file.
@@ -86,15 +251,15 @@ class ConfigManager:
         
         # Use explicit path if provided
         if self.config_path:
-            if self.config_path.exists():
+            if os.path.isfile(str(self.config_path)):
                 return self.config_path
             else:
                 self.logger.warning(f"Specified config file not found: {self.config_path}")
                 return None
         
         # Try default locations
-        for path in self.DEFAULT_CONFIG_PATHS:
-            if path.exists():
+        for path in self._default_paths():
+            if os.path.isfile(path):
                 return path
         
         return None
@@ -102,9 +267,8 @@ class ConfigManager:
     def _load_yaml_file(self, path: Path) -> Dict[str, Any]:
         """Load YAML file safely."""
         try:
-            with open(path, 'r') as f:
-                return yaml.safe_load(f) or {}
-        except yaml.YAMLError as e:
+            return _cached_yaml_load(path)
+        except _YAMLParseError as e:
             self.logger.error(f"Error parsing YAML file {path}: {e}")
             return {}
         except Exception as e:
@@ -132,30 +296,52 @@ class ConfigManager:
         
         # Update managers
         if 'managers' in data:
-            base_config.managers.update(data['managers'])
+            base_config.managers = {**base_config.managers, **data['managers']}
         
         # Update exclusions
         if 'exclude_packages' in data:
-            base_config.exclude_packages.extend(data['exclude_packages'])
+            # Deduplicate while keeping the user's order (entries may mix types)
+            base_config.exclude_packages = list(dict.fromkeys(
+                [*base_config.exclude_packages, *data['exclude_packages']]
+            ))
         
         return base_config
     
-    def get_manager_config(self, manager_name: str) -> Dict[str, Any]:
+    def get_manager_config(self, manager_name: str) -> Mapping[str, Any]:
         """
         Get configuration for a specific manager.
         
+        The result is cached and rebuilt when the global dry_run or
+        exclude_packages settings change. Edits made in place to
+        config.managers need clear_manager_config_cache() to take effect.
+        
         Args:
             manager_name: Name of the package manager
             
         Returns:
-            Configuration dictionary for the manager
+            Read-only view of the manager's configuration
         """
-        manager_config = self.config.managers.get(manager_name, {})
+        key = (self.config.dry_run, tuple(self.config.exclude_packages))
+        cached = self._manager_cfg_cache.get(manager_name)
+        if cached is None or cached[0] != key:
+            cached = (key, MappingProxyType(self._build_manager_config(manager_name)))
+            self._manager_cfg_cache[manager_name] = cached
+        return cached[1]
+    
+    def clear_manager_config_cache(self):
+        """Drop cached manager configurations so the next lookup rebuilds them."""
+        self._manager_cfg_cache.clear()
+    
+    def _build_manager_config(self, manager_name: str) -> Dict[str, Any]:
+        """Build a manager's effective configuration from the loaded config."""
+        # Copy so the loaded configuration is never mutated
+        manager_config = dict(self.config.managers.get(manager_name, {}))
         
         # Add global settings
         manager_config.setdefault('dry_run', self.config.dry_run)
-        manager_config.setdefault('exclude_packages', [])
-        manager_config['exclude_packages'].extend(self.config.exclude_packages)
+        manager_config['exclude_packages'] = tuple(dict.fromkeys(
+            [*(manager_config.get('exclude_packages') or ()), *self.config.exclude_packages]
+        ))
         
         # Set sudo requirements based on manager type
         if manager_name in ['homebrew_casks', 'macos_system']:
@@ -173,7 +359,7 @@ class ConfigManager:
         Returns:
             True if saved successfully
         """
-        save_path = path or self.config_path or self.DEFAULT_CONFIG_PATHS[0]
+        save_path = path or self.config_path or self._default_paths()[0]
         
         # Ensure directory exists
         save_path.parent.mkdir(parents=True, exist_ok=True)
@@ -182,8 +368,10 @@ class ConfigManager:
         config_dict = self._config_to_dict()
         
         try:
+            import yaml
+            
             with open(save_path, 'w') as f:
-                yaml.dump(config_dict, f, default_flow_style=False, sort_keys=True)
+                yaml.dump(config_dict, f, Dumper=_yaml_classes()[1], default_flow_style=False, sort_keys=False)
             
             self.logger.info(f"Configuration saved to {save_path}")
             return True
@@ -193,7 +381,7 @@ class ConfigManager:
             return False
     
     def _config_to_dict(self) -> Dict[str, Any]:
-        """Convert configuration to dictionary."""
+        """Convert configuration to dictionary, in canonical key order."""
         return {
             'log_level': self.config.log_level,
             'log_file': self.config.log_file,
@@ -212,29 +400,34 @@ class ConfigManager:
         Returns:
             List of validation error messages
         """
-        errors = []
+        return list(self.iter_validation_errors())
+    
+    def iter_validation_errors(self) -> Iterator[str]:
+        """
+        Validate current configuration lazily.
+        
+        Use ``next(config_manager.iter_validation_errors(), None)`` to stop
+        at the first error when only validity matters.
         
+        Yields:
+            Validation error messages
+        """
         # Validate log level
-        valid_log_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-        if self.config.log_level not in valid_log_levels:
-            errors.append(f"Invalid log_level: {self.config.log_level}")
+        if not _is_valid_choice(self.config.log_level, _VALID_LOG_LEVELS):
+            yield f"Invalid log_level: {self.config.log_level}"
         
         # Validate sudo mode
-        valid_sudo_modes = ['prompt', 'cache', 'skip', 'homebrew_only']
-        if self.config.sudo_mode not in valid_sudo_modes:
-            errors.append(f"Invalid sudo_mode: {self.config.sudo_mode}")
+        if not _is_valid_choice(self.config.sudo_mode, _VALID_SUDO_MODES):
+            yield f"Invalid sudo_mode: {self.config.sudo_mode}"
         
         # Validate schedule
-        valid_schedules = ['daily', 'weekly', 'monthly']
-        if self.config.schedule not in valid_schedules:
-            errors.append(f"Invalid schedule: {self.config.schedule}")
+        if not _is_valid_choice(self.config.schedule, _VALID_SCHEDULES):
+            yield f"Invalid schedule: {self.config.schedule}"
         
         # Validate manager configurations
         for manager_name, manager_config in self.config.managers.items():
             if not isinstance(manager_config, dict):
-                errors.append(f"Manager config for {manager_name} must be a dictionary")
-        
-        return errors
+                yield f"Manager config for {manager_name} must be a dictionary"
 
 
 def load_default_config() -> Dict[str, Any]:
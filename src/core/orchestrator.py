@@ -5,10 +5,9 @@ System update orchestrator.
 Coordinates updates across all configured package managers.
 """
 
+import asyncio
 import logging
 from typing import Dict, List, Any, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import threading
 
 from .config import ConfigManager
 from .base import PackageManager, UpdateResult, UpdateStatus, PackageInfo
@@ -16,6 +15,9 @@ from .base import PackageManager, UpdateResult, UpdateStatus, PackageInfo
 # Import all available managers
 from managers.homebrew import HomebrewManager
 
+# Upper bound on manager update checks running at once
+_MAX_CONCURRENT_CHECKS = 8
+
 
 class SystemUpdater:
     """
@@ -35,9 +37,6 @@ class SystemUpdater:
         self.config = config_manager.config
         self.logger = logging.getLogger("system-updater.orchestrator")
         
-        # Thread safety
-        self._lock = threading.Lock()
-        
         # Initialize managers
         self.managers = self._initialize_managers()
     
@@ -95,17 +94,21 @@ class SystemUpdater:
         
         self.logger.info(f"Starting updates for {len(enabled_managers)} managers")
         
-        # Sequential updates to avoid conflicts
+        availability = asyncio.run(self._probe_availability(enabled_managers))
+        available = []
         for manager_name, manager in enabled_managers.items():
-            if not manager.is_available():
+            if availability[manager_name]:
+                available.append((manager_name, manager))
+            else:
                 self.logger.warning(f"{manager_name} is not available, skipping")
-                continue
-            
+        
+        # Sequential updates to avoid conflicts
+        for manager_name, manager in available:
             try:
                 self.logger.info(f"Updating {manager_name}")
                 
                 # Update manager itself first
-                if hasattr(manager, 'update_self'):
+                if manager.supports_self_update:
                     self_result = manager.update_self()
                     if self_result.status != UpdateStatus.NOT_AVAILABLE:
                         results.append(self_result)
@@ -125,7 +128,7 @@ class SystemUpdater:
                 ))
         
         # Run cleanup for managers that support it
-        self._run_cleanup(enabled_managers)
+        self._run_cleanup(dict(available))
         
         self.logger.info(f"System update completed: {len(results)} total updates")
         return results
@@ -162,7 +165,7 @@ class SystemUpdater:
                 message="Manager is disabled"
             )]
         
-        if not manager.is_available():
+        if not manager.is_available:
             error_msg = f"{manager_name} is not available"
             self.logger.error(error_msg)
             return [UpdateResult(
@@ -175,7 +178,7 @@ class SystemUpdater:
             self.logger.info(f"Updating {manager_name}")
             
             # Update manager itself first
-            if hasattr(manager, 'update_self'):
+            if manager.supports_self_update:
                 self_result = manager.update_self()
                 if self_result.status != UpdateStatus.NOT_AVAILABLE:
                     results.append(self_result)
@@ -185,7 +188,7 @@ class SystemUpdater:
             results.extend(manager_results)
             
             # Cleanup if supported
-            if hasattr(manager, 'cleanup'):
+            if manager.supports_cleanup:
                 manager.cleanup()
             
             self.logger.info(f"Completed {manager_name}: {len(manager_results)} packages processed")
@@ -204,29 +207,56 @@ class SystemUpdater:
         """
         Check for updates across all managers without applying them.
         
+        Returns:
+            Dictionary mapping manager names to available updates
+        """
+        return asyncio.run(self.check_all_updates_async())
+    
+    async def check_all_updates_async(self) -> Dict[str, List[PackageInfo]]:
+        """
+        Check for updates across all managers concurrently on the event loop.
+        
         Returns:
             Dictionary mapping manager names to available updates
         """
         updates = {}
-        enabled_managers = self.get_enabled_managers()
         
-        for manager_name, manager in enabled_managers.items():
-            if not manager.is_available():
+        for manager_name, manager_updates in (await self.check_enabled_managers_async()).items():
+            if manager_updates is None:
                 continue
-            
-            try:
-                manager_updates = manager.check_updates()
-                if manager_updates:
-                    updates[manager_name] = manager_updates
-                    self.logger.info(f"{manager_name}: {len(manager_updates)} updates available")
-                else:
-                    self.logger.info(f"{manager_name}: Up to date")
-                    
-            except Exception as e:
-                self.logger.error(f"Failed to check updates for {manager_name}: {e}")
+            if isinstance(manager_updates, Exception):
+                self.logger.error(f"Failed to check updates for {manager_name}: {manager_updates}")
+            elif manager_updates:
+                updates[manager_name] = manager_updates
+                self.logger.info(f"{manager_name}: {len(manager_updates)} updates available")
+            else:
+                self.logger.info(f"{manager_name}: Up to date")
         
         return updates
     
+    def check_enabled_managers(self) -> Dict[str, Any]:
+        """
+        Check every enabled manager for updates, keeping each manager's outcome.
+        
+        Returns:
+            Dictionary mapping enabled manager names, in order, to their list
+            of updates, the exception raised while checking, or None if the
+            manager is not available
+        """
+        return asyncio.run(self.check_enabled_managers_async())
+    
+    async def check_enabled_managers_async(self) -> Dict[str, Any]:
+        """Async implementation of check_enabled_managers."""
+        enabled_managers = self.get_enabled_managers()
+        availability = await self._probe_availability(enabled_managers)
+        available = {
+            name: manager for name, manager in enabled_managers.items()
+            if availability[name]
+        }
+        
+        check_results = await self._check_managers(available)
+        return {name: check_results.get(name) for name in enabled_managers}
+    
     def get_system_status(self) -> Dict[str, Any]:
         """
         Get comprehensive system status.
@@ -242,34 +272,74 @@ class SystemUpdater:
             'total_updates_available': 0,
         }
         
+        availability = asyncio.run(self._probe_availability(self.managers))
+        checkable = {
+            name: manager for name, manager in self.managers.items()
+            if manager.enabled and availability[name]
+        }
+        check_results = asyncio.run(self._check_managers(checkable))
+        
         for manager_name, manager in self.managers.items():
             manager_status = {
                 'enabled': manager.enabled,
-                'available': manager.is_available(),
+                'available': availability[manager_name],
                 'updates_available': 0,
                 'error': None
             }
             
-            if manager.enabled and manager.is_available():
+            if manager_name in check_results:
                 status['available_managers'] += 1
                 
-                try:
-                    updates = manager.check_updates()
+                updates = check_results[manager_name]
+                if isinstance(updates, Exception):
+                    manager_status['error'] = str(updates)
+                else:
                     manager_status['updates_available'] = len(updates)
                     status['total_updates_available'] += len(updates)
-                    
-                except Exception as e:
-                    manager_status['error'] = str(e)
             
             status['managers'][manager_name] = manager_status
         
         return status
     
+    async def _probe_availability(self, managers: Dict[str, PackageManager]) -> Dict[str, bool]:
+        """
+        Read is_available for several managers concurrently.
+        
+        Uncached probes shell out, so each runs in a worker thread.
+        
+        Returns:
+            Dictionary mapping manager names, in input order, to availability
+        """
+        probes = await asyncio.gather(
+            *(asyncio.to_thread(getattr, manager, 'is_available') for manager in managers.values())
+        )
+        return dict(zip(managers, probes))
+    
+    async def _check_managers(self, managers: Dict[str, PackageManager]) -> Dict[str, Any]:
+        """
+        Run check_updates_async() on several managers concurrently.
+        
+        Returns:
+            Dictionary mapping manager names, in input order, to their list of
+            updates or the exception raised while checking
+        """
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_CHECKS)
+        
+        async def check(manager: PackageManager) -> List[PackageInfo]:
+            async with semaphore:
+                return await manager.check_updates_async()
+        
+        results = await asyncio.gather(
+            *(check(manager) for manager in managers.values()),
+            return_exceptions=True
+        )
+        return dict(zip(managers, results))
+    
     def _run_cleanup(self, managers: Dict[str, PackageManager]):
         """Run cleanup for managers that support it."""
         
         for manager_name, manager in managers.items():
-            if not hasattr(manager, 'cleanup'):
+            if not manager.supports_cleanup:
                 continue
             
             try:
@@ -288,24 +358,13 @@ class SystemUpdater:
         """
         Perform a dry run to show what would be updated.
         
+        Checking for updates never applies them, so this is the same as
+        check_all_updates() and leaves every manager's dry_run setting alone.
+        
         Returns:
             Dictionary mapping manager names to packages that would be updated
         """
-        # Set all managers to dry run mode temporarily
-        original_dry_run_states = {}
-        
-        try:
-            for manager_name, manager in self.managers.items():
-                original_dry_run_states[manager_name] = manager.dry_run
-                manager.dry_run = True
-            
-            # Check for updates (this is what would be updated)
-            return self.check_all_updates()
-            
-        finally:
-            # Restore original dry run states
-            for manager_name, manager in self.managers.items():
-                manager.dry_run = original_dry_run_states.get(manager_name, False)
+        return self.check_all_updates()
     
     def get_manager_by_name(self, name: str) -> Optional[PackageManager]:
         """Get a specific manager by name."""
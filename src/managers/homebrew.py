@@ -5,154 +5,299 @@ Homebrew package manager implementation.
 Handles updating Homebrew formulae and casks.
 """
 
+import asyncio
+import json
+import os
 import subprocess
 import re
-from typing import List, Dict, Any, Optional
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Set, Tuple, Iterator
 from pathlib import Path
 
 from core.base import PackageManager, PackageInfo, UpdateResult, UpdateStatus
 
 
+def _brew_env(auto_update: bool = False) -> Dict[str, str]:
+    """
+    Build the environment for a brew call from the current os.environ.
+    
+    brew runs without analytics, post-install cleanup or hints. Everything
+    except `brew update-if-needed` (auto_update=True) also skips brew's
+    implicit auto-update, so the explicit update calls are the only update
+    point; those drop any HOMEBREW_NO_AUTO_UPDATE inherited from the user.
+    """
+    env = {
+        **os.environ,
+        "HOMEBREW_NO_ANALYTICS": "1",
+        "HOMEBREW_NO_INSTALL_CLEANUP": "1",
+        "HOMEBREW_NO_ENV_HINTS": "1",
+    }
+    
+    if auto_update:
+        env.pop("HOMEBREW_NO_AUTO_UPDATE", None)
+    else:
+        env["HOMEBREW_NO_AUTO_UPDATE"] = "1"
+    
+    return env
+
+
+def _kill_process_group(pid: int):
+    """SIGKILL a brew started with start_new_session=True, including children holding its pipes."""
+    try:
+        os.killpg(pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+def _decode(output: Optional[bytes]) -> str:
+    """Decode captured brew output, tolerating invalid UTF-8."""
+    return output.decode('utf-8', 'replace') if output else ''
+
+
+def _results_for(names: List[str], manager: str, status: UpdateStatus,
+                 message: Optional[str] = None, error: Optional[str] = None) -> Iterator[UpdateResult]:
+    """Yield the same update outcome for each named package."""
+    return (
+        UpdateResult(
+            package=PackageInfo(name=name, manager=manager),
+            status=status,
+            message=message,
+            error=error
+        )
+        for name in names
+    )
+
+
 class HomebrewManager(PackageManager):
     """Package manager for Homebrew formulae and casks."""
     
+    supports_self_update = True
+    supports_cleanup = True
+    
+    # Seconds a cached outdated-package check, and the Homebrew metadata
+    # refresh it relies on, stay valid
+    UPDATES_CACHE_TTL = 300
+    
     def __init__(self, config: Dict[str, Any], logger=None):
         super().__init__("homebrew", config, logger)
         self.update_formulae = config.get('update_formulae', True)
         self.update_casks = config.get('update_casks', True)
         self.cleanup_enabled = config.get('cleanup', True)
+        self._casks_set: Set[str] = set()
+        self._casks_loaded = False
+        self._updated_at: Optional[float] = None
+        self._updates_cache: Optional[Tuple[List[PackageInfo], List[PackageInfo]]] = None
+        self._updates_cache_ts = 0.0
         
-    def is_available(self) -> bool:
+    def _brew(self, *args: str, stdin=subprocess.DEVNULL, auto_update: bool = False,
+              **kwargs) -> subprocess.CompletedProcess:
+        """Run a brew command with the shared environment and stdin closed by default."""
+        return subprocess.run(['brew', *args], stdin=stdin, env=_brew_env(auto_update), **kwargs)
+    
+    def _probe_available(self) -> bool:
         """Check if Homebrew is installed and available."""
         try:
-            result = subprocess.run(['brew', '--version'], 
-                                  capture_output=True, text=True, timeout=10)
-            return result.returncode == 0
+            result = self._brew('--version', stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL, timeout=10)
         except (subprocess.SubprocessError, FileNotFoundError):
             return False
+        
+        return result.returncode == 0
     
     def check_updates(self) -> List[PackageInfo]:
         """Check for available Homebrew updates."""
-        updates = []
+        formulae, casks = self._collect_outdated()
+        return formulae + casks
+    
+    async def check_updates_async(self) -> List[PackageInfo]:
+        """Check for available Homebrew updates without blocking the event loop."""
+        formulae, casks = await self._collect_outdated_async()
+        return formulae + casks
+    
+    def _collect_outdated(self) -> Tuple[List[PackageInfo], List[PackageInfo]]:
+        """Check for outdated packages, returning (formulae, casks) separately."""
+        return asyncio.run(self._collect_outdated_async())
+    
+    async def _collect_outdated_async(self) -> Tuple[List[PackageInfo], List[PackageInfo]]:
+        """Async implementation of _collect_outdated; formulae and casks are checked concurrently."""
+        if (self._updates_cache is not None
+                and time.monotonic() - self._updates_cache_ts < self.UPDATES_CACHE_TTL):
+            return self._updates_cache
+        
+        formulae: List[PackageInfo] = []
+        casks: List[PackageInfo] = []
         
-        if not self.is_available():
+        if not self.is_available:
             self.log_warning("Homebrew not available")
-            return updates
+            return formulae, casks
+        
+        # Update Homebrew itself first, unless that was done recently
+        if not self._recently_updated():
+            try:
+                result = await self._run_brew_async(['update-if-needed'], timeout=120,
+                                                    auto_update=True)
+                if result.returncode == 0:
+                    self._updated_at = time.monotonic()
+            except subprocess.TimeoutExpired:
+                self.log_error("Homebrew update timed out")
+                return formulae, casks
+        
+        # Check formulae and cask updates; a failed check is not cached
+        if self.update_formulae or self.update_casks:
+            outdated = await self._check_outdated()
+            if outdated is None:
+                return formulae, casks
+            formulae, casks = outdated
+        
+        self._updates_cache = (formulae, casks)
+        self._updates_cache_ts = time.monotonic()
+        return formulae, casks
+    
+    async def _run_brew_async(self, args: List[str], timeout: float,
+                              auto_update: bool = False) -> subprocess.CompletedProcess:
+        """
+        Run a brew command on the event loop, capturing its output.
+        
+        Raises subprocess.TimeoutExpired (after killing brew) on timeout, like
+        subprocess.run.
+        """
+        cmd = ['brew', *args]
+        # Own session so a timeout also kills git/curl children holding the pipes,
+        # which would otherwise keep proc.wait() from returning
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            env=_brew_env(auto_update), start_new_session=True
+        )
         
-        # Update Homebrew itself first
         try:
-            subprocess.run(['brew', 'update'], capture_output=True, timeout=120)
-        except subprocess.TimeoutExpired:
-            self.log_error("Homebrew update timed out")
-            return updates
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            _kill_process_group(proc.pid)
+            await proc.wait()
+            raise subprocess.TimeoutExpired(cmd, timeout)
         
-        # Check formulae updates
-        if self.update_formulae:
-            updates.extend(self._check_formulae_updates())
-            
-        # Check cask updates  
-        if self.update_casks:
-            updates.extend(self._check_cask_updates())
-            
-        return updates
+        return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
     
-    def _check_formulae_updates(self) -> List[PackageInfo]:
-        """Check for outdated formulae."""
-        updates = []
+    def _recently_updated(self) -> bool:
+        """Whether Homebrew's metadata was refreshed within UPDATES_CACHE_TTL."""
+        return (self._updated_at is not None
+                and time.monotonic() - self._updated_at < self.UPDATES_CACHE_TTL)
+    
+    def _invalidate_updates_cache(self):
+        """Drop the cached outdated check after anything that changes Homebrew state."""
+        self._updates_cache = None
+    
+    async def _check_outdated(self) -> Optional[Tuple[List[PackageInfo], List[PackageInfo]]]:
+        """
+        Check for outdated formulae and casks with a single brew process.
+        
+        `brew outdated --json=v2` reports both kinds, so it is only narrowed
+        with --formula/--cask when one kind is disabled.
+        
+        Returns:
+            (formulae, casks), or None if the check failed
+        """
+        formulae: List[PackageInfo] = []
+        casks: List[PackageInfo] = []
+        
+        args = ['outdated', '--json=v2']
+        if not self.update_casks:
+            args.insert(1, '--formula')
+        elif not self.update_formulae:
+            args.insert(1, '--cask')
         
         try:
-            result = subprocess.run(['brew', 'outdated', '--json=v2'], 
-                                  capture_output=True, text=True, timeout=30)
+            result = await self._run_brew_async(args, timeout=30)
             
-            if result.returncode == 0:
-                import json
-                data = json.loads(result.stdout)
-                
-                for formula in data.get('formulae', []):
-                    package = PackageInfo(
-                        name=formula['name'],
-                        current_version=formula['installed_versions'][0] if formula['installed_versions'] else None,
-                        available_version=formula['current_version'],
-                        manager='homebrew'
-                    )
-                    
-                    if self.should_update_package(package.name):
-                        updates.append(package)
-                    else:
-                        self.log_info(f"Skipping excluded package: {package.name}")
+            if result.returncode != 0:
+                self.log_error(f"Failed to check outdated packages: brew exited with {result.returncode}")
+                return None
+            
+            data = json.loads(result.stdout)
+            
+            if self.update_formulae:
+                formulae = self._parse_outdated(data.get('formulae', []), 'homebrew', 'package')
+            if self.update_casks:
+                casks = self._parse_outdated(data.get('casks', []), 'homebrew_cask', 'cask')
                         
-        except (subprocess.SubprocessError, json.JSONDecodeError) as e:
-            self.log_error(f"Failed to check formulae updates: {e}")
+        except (subprocess.SubprocessError, json.JSONDecodeError, UnicodeDecodeError) as e:
+            self.log_error(f"Failed to check outdated packages: {e}")
+            return None
             
-        return updates
+        return formulae, casks
     
-    def _check_cask_updates(self) -> List[PackageInfo]:
-        """Check for outdated casks."""
+    def _parse_outdated(self, entries: List[Dict[str, Any]], manager: str, kind: str) -> List[PackageInfo]:
+        """Convert `brew outdated` JSON entries to packages, dropping excluded ones."""
         updates = []
         
-        try:
-            result = subprocess.run(['brew', 'outdated', '--cask', '--json=v2'], 
-                                  capture_output=True, text=True, timeout=30)
-            
-            if result.returncode == 0:
-                import json
-                data = json.loads(result.stdout)
-                
-                for cask in data.get('casks', []):
-                    package = PackageInfo(
-                        name=cask['name'],
-                        current_version=cask['installed_versions'][0] if cask['installed_versions'] else None,
-                        available_version=cask['current_version'],
-                        manager='homebrew_cask'
-                    )
-                    
-                    if self.should_update_package(package.name):
-                        updates.append(package)
-                    else:
-                        self.log_info(f"Skipping excluded cask: {package.name}")
-                        
-        except (subprocess.SubprocessError, json.JSONDecodeError) as e:
-            self.log_error(f"Failed to check cask updates: {e}")
+        for entry in entries:
+            package = PackageInfo(
+                name=entry['name'],
+                current_version=entry['installed_versions'][0] if entry['installed_versions'] else None,
+                available_version=entry['current_version'],
+                manager=manager
+            )
             
+            if self.should_update_package(package.name):
+                updates.append(package)
+            else:
+                self.log_info(f"Skipping excluded {kind}: {package.name}")
+        
         return updates
     
     def update_packages(self, packages: Optional[List[str]] = None) -> List[UpdateResult]:
         """Update Homebrew packages."""
         results = []
         
-        if not self.is_available():
+        if not self.is_available:
             return [UpdateResult(
                 package=PackageInfo(name="homebrew", manager="homebrew"),
                 status=UpdateStatus.NOT_AVAILABLE,
                 error="Homebrew not available"
             )]
         
-        # Get packages to update
+        # Get packages to update, separated into formulae and casks
         if packages is None:
-            available_updates = self.check_updates()
-            packages = [pkg.name for pkg in available_updates]
+            # The outdated check already knows which packages are casks
+            outdated_formulae, outdated_casks = self._collect_outdated()
+            formulae = [pkg.name for pkg in outdated_formulae]
+            casks = [pkg.name for pkg in outdated_casks]
+        else:
+            # Anything that is not an installed cask is upgraded as a formula
+            self._load_casks_set()
+            formulae = [pkg_name for pkg_name in packages if pkg_name not in self._casks_set]
+            casks = [pkg_name for pkg_name in packages if pkg_name in self._casks_set]
         
-        if not packages:
+        if not formulae and not casks:
             self.log_info("No packages to update")
             return results
         
-        # Separate formulae and casks
-        formulae = []
-        casks = []
+        # Upgrading changes what is outdated
+        self._invalidate_updates_cache()
         
-        for pkg_name in packages:
-            if self._is_cask(pkg_name):
-                casks.append(pkg_name)
-            else:
-                formulae.append(pkg_name)
+        upgrade_formulae = bool(formulae) and self.update_formulae
+        upgrade_casks = bool(casks) and self.update_casks
         
-        # Update formulae
-        if formulae and self.update_formulae:
-            results.extend(self._update_formulae(formulae))
+        if upgrade_formulae and upgrade_casks and not self.dry_run and not self.requires_sudo():
+            # Formula and cask upgrades don't interfere, so run both brew
+            # processes at once. Sudo cask upgrades stay sequential because
+            # their password prompt needs the terminal.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                formula_results = executor.submit(self._update_formulae, formulae)
+                cask_results = executor.submit(self._update_casks, casks)
+                results.extend(formula_results.result())
+                results.extend(cask_results.result())
+        else:
+            # Update formulae
+            if upgrade_formulae:
+                results.extend(self._update_formulae(formulae))
             
-        # Update casks
-        if casks and self.update_casks:
-            results.extend(self._update_casks(casks))
+            # Update casks
+            if upgrade_casks:
+                results.extend(self._update_casks(casks))
             
         # Cleanup if enabled
         if self.cleanup_enabled:
@@ -160,146 +305,111 @@ class HomebrewManager(PackageManager):
             
         return results
     
-    def _update_formulae(self, formulae: List[str]) -> List[UpdateResult]:
-        """Update specific formulae."""
-        results = []
-        
+    def _update_formulae(self, formulae: List[str]) -> Iterator[UpdateResult]:
+        """Update specific formulae, yielding one result per formula."""
         self.log_info(f"Updating {len(formulae)} formulae")
         
         if self.dry_run:
-            for formula in formulae:
-                results.append(UpdateResult(
-                    package=PackageInfo(name=formula, manager="homebrew"),
-                    status=UpdateStatus.SKIPPED,
-                    message="Dry run mode"
-                ))
-            return results
+            return _results_for(formulae, "homebrew", UpdateStatus.SKIPPED, message="Dry run mode")
         
         try:
-            cmd = ['brew', 'upgrade'] + formulae
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
-            
-            if result.returncode == 0:
-                for formula in formulae:
-                    results.append(UpdateResult(
-                        package=PackageInfo(name=formula, manager="homebrew"),
-                        status=UpdateStatus.SUCCESS,
-                        message="Updated successfully"
-                    ))
-                self.log_info(f"Successfully updated {len(formulae)} formulae")
-            else:
-                for formula in formulae:
-                    results.append(UpdateResult(
-                        package=PackageInfo(name=formula, manager="homebrew"),
-                        status=UpdateStatus.FAILED,
-                        error=result.stderr
-                    ))
-                self.log_error(f"Failed to update formulae: {result.stderr}")
-                
+            result = self._brew('upgrade', *formulae, capture_output=True, timeout=300)
         except subprocess.TimeoutExpired:
-            for formula in formulae:
-                results.append(UpdateResult(
-                    package=PackageInfo(name=formula, manager="homebrew"),
-                    status=UpdateStatus.FAILED,
-                    error="Update timed out"
-                ))
             self.log_error("Formulae update timed out")
-            
-        return results
-    
-    def _update_casks(self, casks: List[str]) -> List[UpdateResult]:
-        """Update specific casks."""
-        results = []
+            return _results_for(formulae, "homebrew", UpdateStatus.FAILED, error="Update timed out")
+        
+        if result.returncode == 0:
+            self.log_info(f"Successfully updated {len(formulae)} formulae")
+            return _results_for(formulae, "homebrew", UpdateStatus.SUCCESS, message="Updated successfully")
         
+        error = _decode(result.stderr)
+        self.log_error(f"Failed to update formulae: {error}")
+        return _results_for(formulae, "homebrew", UpdateStatus.FAILED, error=error)
+    
+    def _update_casks(self, casks: List[str]) -> Iterator[UpdateResult]:
+        """Update specific casks, yielding one result per cask."""
         self.log_info(f"Updating {len(casks)} casks")
         
         if self.dry_run:
-            for cask in casks:
-                results.append(UpdateResult(
-                    package=PackageInfo(name=cask, manager="homebrew_cask"),
-                    status=UpdateStatus.SKIPPED,
-                    message="Dry run mode"
-                ))
-            return results
+            return _results_for(casks, "homebrew_cask", UpdateStatus.SKIPPED, message="Dry run mode")
         
         # Casks often require sudo, handle appropriately
         requires_sudo = self.requires_sudo()
         
         try:
-            cmd = ['brew', 'upgrade', '--cask'] + casks
-            
             if requires_sudo:
-                # This might prompt for password
-                result = subprocess.run(cmd, timeout=600)
+                # This might prompt for password, so keep the terminal attached
+                result = self._brew('upgrade', '--cask', *casks, stdin=None, timeout=600)
             else:
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
-            
-            if result.returncode == 0:
-                for cask in casks:
-                    results.append(UpdateResult(
-                        package=PackageInfo(name=cask, manager="homebrew_cask"),
-                        status=UpdateStatus.SUCCESS,
-                        message="Updated successfully"
-                    ))
-                self.log_info(f"Successfully updated {len(casks)} casks")
-            else:
-                for cask in casks:
-                    results.append(UpdateResult(
-                        package=PackageInfo(name=cask, manager="homebrew_cask"),
-                        status=UpdateStatus.FAILED,
-                        error="Update failed"
-                    ))
-                self.log_error("Failed to update casks")
-                
+                result = self._brew('upgrade', '--cask', *casks, capture_output=True, timeout=600)
         except subprocess.TimeoutExpired:
-            for cask in casks:
-                results.append(UpdateResult(
-                    package=PackageInfo(name=cask, manager="homebrew_cask"),
-                    status=UpdateStatus.FAILED,
-                    error="Update timed out"
-                ))
             self.log_error("Cask update timed out")
-            
-        return results
+            return _results_for(casks, "homebrew_cask", UpdateStatus.FAILED, error="Update timed out")
+        
+        if result.returncode == 0:
+            self.log_info(f"Successfully updated {len(casks)} casks")
+            return _results_for(casks, "homebrew_cask", UpdateStatus.SUCCESS, message="Updated successfully")
+        
+        self.log_error("Failed to update casks")
+        return _results_for(casks, "homebrew_cask", UpdateStatus.FAILED, error="Update failed")
     
-    def _is_cask(self, package_name: str) -> bool:
-        """Check if a package is a cask."""
+    def _load_casks_set(self):
+        """Fetch the installed cask names once per instance."""
+        if self._casks_loaded:
+            return
+        
         try:
-            result = subprocess.run(['brew', 'info', '--cask', package_name], 
-                                  capture_output=True, text=True, timeout=10)
-            return result.returncode == 0
-        except subprocess.SubprocessError:
-            return False
+            result = self._brew('list', '--cask', '-1', capture_output=True, timeout=30)
+        except (subprocess.SubprocessError, FileNotFoundError) as e:
+            self.log_error(f"Failed to list installed casks: {e}")
+            return
+        
+        if result.returncode == 0:
+            self._casks_set = set(_decode(result.stdout).splitlines())
+            self._casks_loaded = True
     
     def cleanup(self) -> bool:
         """Clean up old Homebrew installations."""
         if not self.cleanup_enabled:
             return True
-            
+        
+        self._invalidate_updates_cache()
+        
+        self.log_info("Running Homebrew cleanup")
+        
         try:
-            self.log_info("Running Homebrew cleanup")
-            result = subprocess.run(['brew', 'cleanup'], 
-                                  capture_output=True, text=True, timeout=120)
-            
-            if result.returncode == 0:
-                self.log_info("Homebrew cleanup completed")
-                return True
-            else:
-                self.log_error(f"Cleanup failed: {result.stderr}")
-                return False
-                
-        except subprocess.SubprocessError as e:
+            result = self._brew('cleanup', stdout=subprocess.DEVNULL,
+                                stderr=subprocess.PIPE, timeout=120)
+        except (subprocess.SubprocessError, FileNotFoundError) as e:
             self.log_error(f"Cleanup failed: {e}")
             return False
+        
+        if result.returncode != 0:
+            self.log_error(f"Cleanup failed: {_decode(result.stderr)}")
+            return False
+        
+        self.log_info("Homebrew cleanup completed")
+        return True
     
     def update_self(self) -> UpdateResult:
         """Update Homebrew itself."""
+        # An update already done by the outdated check counts as this one
+        if self._recently_updated():
+            return UpdateResult(
+                package=PackageInfo(name="homebrew", manager="homebrew"),
+                status=UpdateStatus.SUCCESS,
+                message="Homebrew already up to date"
+            )
+        
+        self._invalidate_updates_cache()
+        
         try:
             self.log_info("Updating Homebrew")
-            result = subprocess.run(['brew', 'update'], 
-                                  capture_output=True, text=True, timeout=120)
+            result = self._brew('update-if-needed', capture_output=True, timeout=120,
+                                auto_update=True)
             
             if result.returncode == 0:
+                self._updated_at = time.monotonic()
                 return UpdateResult(
                     package=PackageInfo(name="homebrew", manager="homebrew"),
                     status=UpdateStatus.SUCCESS,
@@ -309,7 +419,7 @@ class HomebrewManager(PackageManager):
                 return UpdateResult(
                     package=PackageInfo(name="homebrew", manager="homebrew"),
                     status=UpdateStatus.FAILED,
-                    error=result.stderr
+                    error=_decode(result.stderr)
                 )
                 
         except subprocess.SubprocessError as e:
@@ -323,45 +433,75 @@ class HomebrewManager(PackageManager):
         """Get list of installed Homebrew packages."""
         packages = []
         
-        if not self.is_available():
+        if not self.is_available:
             return packages
         
         try:
             # Get formulae
-            result = subprocess.run(['brew', 'list', '--versions'], 
-                                  capture_output=True, text=True, timeout=30)
-            
-            if result.returncode == 0:
-                for line in result.stdout.strip().split('\n'):
-                    if line:
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            name = parts[0]
-                            version = parts[1]
-                            packages.append(PackageInfo(
-                                name=name,
-                                current_version=version,
-                                manager='homebrew'
-                            ))
+            formulae = self._list_versions(['list', '--versions'], 'homebrew')
+            packages.extend(formulae or [])
             
             # Get casks
-            result = subprocess.run(['brew', 'list', '--cask', '--versions'], 
-                                  capture_output=True, text=True, timeout=30)
+            casks = self._list_versions(['list', '--cask', '--versions'], 'homebrew_cask')
+            packages.extend(casks or [])
             
-            if result.returncode == 0:
-                for line in result.stdout.strip().split('\n'):
-                    if line:
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            name = parts[0]
-                            version = parts[1]
-                            packages.append(PackageInfo(
-                                name=name,
-                                current_version=version,
-                                manager='homebrew_cask'
-                            ))
-                            
-        except subprocess.SubprocessError as e:
+        except (subprocess.SubprocessError, OSError) as e:
             self.log_error(f"Failed to get installed packages: {e}")
+            return packages
+        
+        # A successful cask listing also classifies packages for update_packages
+        if casks is not None:
+            self._casks_set = {pkg.name for pkg in casks}
+            self._casks_loaded = True
             
-        return packages
\ No newline at end of file
+        return packages
+    
+    def _list_versions(self, args: List[str], manager: str) -> Optional[List[PackageInfo]]:
+        """
+        Run a `brew list --versions` command, parsing its output as it streams.
+        
+        Only the first listed version of each package is kept.
+        
+        Returns:
+            Parsed packages, or None if brew exited with an error
+            
+        Raises:
+            subprocess.TimeoutExpired: brew did not finish within 30 seconds
+        """
+        cmd = ['brew', *args]
+        timeout = 30
+        packages = []
+        timed_out = threading.Event()
+        
+        # brew runs in its own session so the whole process group, including
+        # any child still holding stdout open, can be killed on timeout
+        with subprocess.Popen(cmd, stdin=subprocess.DEVNULL, env=_brew_env(),
+                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                              start_new_session=True) as proc:
+            
+            def kill():
+                timed_out.set()
+                _kill_process_group(proc.pid)
+            
+            # Reading stdout blocks until brew closes it, so the deadline is
+            # enforced by a timer rather than by wait()
+            timer = threading.Timer(timeout, kill)
+            timer.start()
+            try:
+                for raw in proc.stdout:
+                    parts = _decode(raw).split(maxsplit=2)
+                    if len(parts) >= 2:
+                        packages.append(PackageInfo(
+                            name=parts[0],
+                            current_version=parts[1],
+                            manager=manager
+                        ))
+                
+                returncode = proc.wait()
+            finally:
+                timer.cancel()
+        
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        
+        return packages if returncode == 0 else None
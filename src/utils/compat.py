@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+"""
+Compatibility helpers for the supported Python versions (3.9+).
+"""
+
+import sys
+
+
+# dataclass(slots=True) needs Python 3.10; older interpreters (such as
+# macOS's stock 3.9) get regular dataclasses. Use as @dataclass(**DATACLASS_SLOTS).
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}